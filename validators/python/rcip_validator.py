@@ -6,16 +6,57 @@ Version: 1.0.0
 License: MIT
 """
 
+import functools
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-import jsonschema
-from jsonschema import validate, ValidationError, Draft7Validator
+from itertools import islice
+from jsonschema import Draft7Validator
+
+try:
+    import jsonschema_rs  # Rust-backed validator (optional, much faster)
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import orjson  # optional, 2-5x faster JSON parsing
+except ImportError:
+    orjson = None
+
+def _load_json(path: Any) -> Any:
+    """Load a JSON document, using orjson when available"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_schema(schema_path: str) -> Tuple[Dict[str, Any], Any, bool]:
+    """
+    Load and compile a schema once per path
+
+    The compiled validator is shared by every RCIPValidator pointed at
+    the same schema file, so repeated init() calls are essentially free.
+
+    Returns:
+        (schema dict, compiled validator, rust backend flag)
+    """
+    schema = _load_json(schema_path)
+    if jsonschema_rs is not None:
+        # validator_for replaces the deprecated JSONSchema constructor in
+        # newer jsonschema-rs releases; support both
+        compile_schema = getattr(jsonschema_rs, 'validator_for', None) or jsonschema_rs.JSONSchema
+        return schema, compile_schema(schema), True
+    return schema, Draft7Validator(schema), False
 
 
 class DietLabel(Enum):
@@ -128,16 +169,41 @@ class Unit(Enum):
     TO_TASTE = "to-taste"
 
 
-@dataclass
+# dataclass(slots=True) drops the per-instance __dict__ (smaller results,
+# faster attribute access) but needs Python 3.10+; fall back gracefully
+if sys.version_info >= (3, 10):
+    _slots_dataclass = functools.partial(dataclass, slots=True)
+else:
+    _slots_dataclass = dataclass
+
+
+@_slots_dataclass
 class ValidationResult:
-    """Validation result structure"""
+    """
+    Validation result structure
+
+    Schema errors are stored unformatted as (path, message) tuples and
+    rendered on demand; use format_errors() for display strings.
+    """
     valid: bool
-    errors: List[str] = field(default_factory=list)
+    errors: List[Any] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     info: Dict[str, Any] = field(default_factory=dict)
 
+    def format_errors(self, limit: Optional[int] = None) -> List[str]:
+        """Render errors to display strings, formatting lazy entries"""
+        entries = self.errors if limit is None else self.errors[:limit]
+        formatted = []
+        for entry in entries:
+            if isinstance(entry, str):
+                formatted.append(entry)
+            else:
+                path, message = entry
+                formatted.append(f"{' > '.join(map(str, path))}: {message}")
+        return formatted
 
-@dataclass
+
+@_slots_dataclass
 class ValidationStats:
     """Validation statistics"""
     validated: int = 0
@@ -148,19 +214,58 @@ class ValidationStats:
 class RCIPValidator:
     """RCIP Format Validator"""
 
-    RECIPE_ID_PATTERN = re.compile(r'^rcip-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$')
-    INGREDIENT_ID_PATTERN = re.compile(r'^ing-[0-9a-zA-Z]+$')
-    STEP_ID_PATTERN = re.compile(r'^s-[0-9a-zA-Z]+$')
-    VERSION_PATTERN = re.compile(r'^\d+\.\d+\.\d+$')
-    COUNTRY_CODE_PATTERN = re.compile(r'^[A-Z]{2}$')
-
-    def __init__(self, schema_version: str = "0.1"):
+    # Kept anchored for external callers using match(); internal checks
+    # use the _is_*_id string helpers below instead
+    RECIPE_ID_PATTERN = re.compile(r'^rcip-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.ASCII)
+    INGREDIENT_ID_PATTERN = re.compile(r'^ing-[0-9a-zA-Z]+$', re.ASCII)
+    STEP_ID_PATTERN = re.compile(r'^s-[0-9a-zA-Z]+$', re.ASCII)
+    VERSION_PATTERN = re.compile(r'^\d+\.\d+\.\d+$', re.ASCII)
+    COUNTRY_CODE_PATTERN = re.compile(r'^[A-Z]{2}$', re.ASCII)
+
+    # Enum value sets, precomputed once (hot-path membership tests)
+    _ALLERGEN_VALUES = frozenset(a.value for a in Allergen)
+    _UNIT_VALUES = frozenset(u.value for u in Unit)
+    _ACTION_VALUES = frozenset(a.value for a in CookingAction)
+    _VALID_HAZARDS = frozenset({'hot-surface', 'sharp-tool', 'electrical', 'chemical', 'pressure',
+                                'allergen-cross-contact'})
+    _HEX_CHARS = frozenset('0123456789abcdef-')
+
+    # Bit per known allergen: aggregation is an integer OR and
+    # deduplication comes for free
+    _ALLERGEN_BIT = {a.value: 1 << i for i, a in enumerate(Allergen)}
+    _ALLERGEN_ORDER = sorted(_ALLERGEN_BIT)
+
+    def __init__(self, schema_version: str = "0.1", quiet: bool = False):
         """Initialize validator with schema version"""
         self.schema_version = schema_version
+        self.quiet = quiet
         self.schema = None
         self.validator = None
+        self._rust_backend = False
+        self._schema_path = None
         self.stats = ValidationStats()
 
+    @classmethod
+    def _is_recipe_id(cls, s: str) -> bool:
+        """Fixed-layout check equivalent to RECIPE_ID_PATTERN, minus the regex engine"""
+        return (
+            len(s) == 41
+            and s.startswith('rcip-')
+            and s[13] == '-' and s[18] == '-' and s[23] == '-' and s[28] == '-'
+            and s.count('-') == 5
+            and all(c in cls._HEX_CHARS for c in s[5:])
+        )
+
+    @staticmethod
+    def _is_ingredient_id(s: str) -> bool:
+        """Equivalent to INGREDIENT_ID_PATTERN (ing- prefix + ASCII alphanumerics)"""
+        return len(s) > 4 and s.startswith('ing-') and s[4:].isalnum() and s.isascii()
+
+    @staticmethod
+    def _is_step_id(s: str) -> bool:
+        """Equivalent to STEP_ID_PATTERN (s- prefix + ASCII alphanumerics)"""
+        return len(s) > 2 and s.startswith('s-') and s[2:].isalnum() and s.isascii()
+
     def init(self, schema_path: Optional[Path] = None) -> None:
         """
         Initialize validator with schema
@@ -171,23 +276,26 @@ class RCIPValidator:
         if schema_path is None:
             schema_path = Path(__file__).parent.parent.parent / "schemas" / f"rcip-v{self.schema_version}.json"
 
-        try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                self.schema = json.load(f)
+        self._schema_path = schema_path
 
-            self.validator = Draft7Validator(self.schema)
-            print(f"✅ RCIP Validator initialized with schema v{self.schema_version}")
+        try:
+            self.schema, self.validator, self._rust_backend = _compile_schema(str(schema_path))
+            if not self.quiet:
+                print(f"✅ RCIP Validator initialized with schema v{self.schema_version}")
         except FileNotFoundError:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in schema file: {e}")
 
-    def validate_recipe(self, recipe: Dict[str, Any]) -> ValidationResult:
+    def validate_recipe(self, recipe: Dict[str, Any], max_errors: Optional[int] = 10) -> ValidationResult:
         """
         Validate a recipe object
 
         Args:
             recipe: Recipe dictionary to validate
+            max_errors: Stop collecting schema errors after this many
+                (None for no limit); must be positive so at least one
+                error is recorded and validity is unaffected
 
         Returns:
             ValidationResult object
@@ -195,27 +303,30 @@ class RCIPValidator:
         if self.validator is None:
             raise RuntimeError("Validator not initialized. Call init() first.")
 
+        if max_errors is not None and max_errors <= 0:
+            raise ValueError("max_errors must be a positive integer or None")
+
         result = ValidationResult(valid=True)
 
-        # JSON Schema validation
-        try:
-            self.validator.validate(recipe)
-        except ValidationError as e:
+        # JSON Schema validation (single iter_errors pass, truncated early
+        # since reporting only shows the first few errors anyway)
+        schema_errors = self.validator.iter_errors(recipe)
+        if max_errors is not None:
+            schema_errors = islice(schema_errors, max_errors)
+        for error in schema_errors:
             result.valid = False
-            result.errors.append(f"Schema validation failed: {e.message}")
-            # Collect all errors
-            for error in self.validator.iter_errors(recipe):
-                error_path = " > ".join(str(p) for p in error.path)
-                result.errors.append(f"{error_path}: {error.message}")
+            path = error.instance_path if self._rust_backend else error.path
+            # Defer path/message formatting until the error is displayed
+            result.errors.append((tuple(path), error.message))
 
-        # Custom validations
-        self._validate_custom_rules(recipe, result)
+        # Custom validations (single walk over ingredients and steps)
+        summary = self._validate_custom_rules(recipe, result)
 
         # Check warnings
-        result.warnings = self._check_warnings(recipe)
+        result.warnings.extend(self._check_warnings(recipe, summary))
 
         # Get recipe info
-        result.info = self._get_recipe_info(recipe)
+        result.info = self._get_recipe_info(recipe, summary)
 
         # Update stats
         self.stats.validated += 1
@@ -226,7 +337,7 @@ class RCIPValidator:
 
         return result
 
-    def validate_file(self, file_path: Path) -> ValidationResult:
+    def validate_file(self, file_path: Union[str, os.PathLike]) -> ValidationResult:
         """
         Validate a recipe file
 
@@ -237,21 +348,28 @@ class RCIPValidator:
             ValidationResult object
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                recipe = json.load(f)
+            recipe = _load_json(file_path)
 
-            print(f"\n📄 Validating: {file_path.name}")
+            if not self.quiet:
+                print(f"\n📄 Validating: {os.path.basename(file_path)}")
             result = self.validate_recipe(recipe)
 
-            self._print_result(result, recipe.get('meta', {}).get('name', 'Unknown Recipe'))
+            if not self.quiet:
+                self._print_result(result, recipe.get('meta', {}).get('name', 'Unknown Recipe'))
             return result
 
         except FileNotFoundError:
+            # Unreadable files still count as failed validations so the
+            # sequential and parallel directory stats agree
+            self.stats.validated += 1
+            self.stats.failed += 1
             return ValidationResult(
                 valid=False,
                 errors=[f"File not found: {file_path}"]
             )
         except json.JSONDecodeError as e:
+            self.stats.validated += 1
+            self.stats.failed += 1
             return ValidationResult(
                 valid=False,
                 errors=[f"Invalid JSON: {e}"]
@@ -267,49 +385,146 @@ class RCIPValidator:
         Returns:
             List of validation results
         """
-        recipe_files = list(directory.glob("*.rcip")) + list(directory.glob("*.json"))
-        print(f"\n🔍 Found {len(recipe_files)} recipe files to validate\n")
+        if self.validator is None:
+            raise RuntimeError("Validator not initialized. Call init() first.")
+
+        # Single scandir pass instead of two glob() walks; keep plain str
+        # paths, a Path object per file buys nothing here
+        with os.scandir(directory) as entries:
+            recipe_files = [
+                entry.path
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(('.rcip', '.json'))
+            ]
+        if not self.quiet:
+            print(f"\n🔍 Found {len(recipe_files)} recipe files to validate\n")
 
         results = []
-        for file_path in recipe_files:
-            result = self.validate_file(file_path)
-            results.append({
-                "file": file_path.name,
-                "result": result
-            })
-
-        self._print_summary()
+        if len(recipe_files) > 1:
+            # Validation is CPU-bound and independent per file: fan out
+            # across cores and aggregate stats from the returned results
+            with ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_worker,
+                initargs=(str(self._schema_path), self.schema_version, self.quiet)
+            ) as pool:
+                for file_name, result in pool.map(_validate_worker, recipe_files):
+                    results.append({
+                        "file": file_name,
+                        "result": result
+                    })
+                    self.stats.validated += 1
+                    if result.valid:
+                        self.stats.passed += 1
+                    else:
+                        self.stats.failed += 1
+        else:
+            for file_path in recipe_files:
+                result = self.validate_file(file_path)
+                results.append({
+                    "file": os.path.basename(file_path),
+                    "result": result
+                })
+
+        if not self.quiet:
+            self._print_summary()
         return results
 
-    def _validate_custom_rules(self, recipe: Dict[str, Any], result: ValidationResult) -> None:
+    def _validate_custom_rules(self, recipe: Dict[str, Any], result: ValidationResult) -> Dict[str, Any]:
         """Apply custom validation rules beyond JSON schema"""
 
         # Validate recipe ID format
-        if 'id' in recipe and not self.RECIPE_ID_PATTERN.match(recipe['id']):
+        if 'id' in recipe and not self._is_recipe_id(recipe['id']):
             result.valid = False
             result.errors.append(f"Invalid recipe ID format: {recipe['id']}")
 
-        # Validate ingredients
-        for i, ingredient in enumerate(recipe.get('ingredients', [])):
-            self._validate_ingredient(ingredient, i, result)
-
-        # Validate steps
-        for i, step in enumerate(recipe.get('steps', [])):
-            self._validate_step(step, i, result)
-
-        # Validate cross-references
-        self._validate_references(recipe, result)
+        # Validate ingredients, steps and cross-references in one pass
+        summary = self._walk_recipe(recipe, result)
 
         # Validate version compatibility
         if 'rcip_version' in recipe and recipe['rcip_version'] != self.schema_version:
             result.warnings.append(
                 f"Recipe version {recipe['rcip_version']} may not be fully compatible with validator version {self.schema_version}")
 
+        return summary
+
+    def _walk_recipe(self, recipe: Dict[str, Any], result: ValidationResult) -> Dict[str, Any]:
+        """
+        Traverse ingredients and steps once, validating each item and
+        collecting the aggregates used by warnings and recipe info
+
+        Returns:
+            Summary dict with ingredient_ids, step_ids, allergens,
+            has_nutritional and has_external_ids
+        """
+        ingredient_ids = set()
+        step_ids = set()
+        allergen_mask = 0
+        unknown_allergens = set()
+        has_nutritional = False
+        has_external_ids = False
+
+        allergen_bit = self._ALLERGEN_BIT
+        for i, ingredient in enumerate(recipe.get('ingredients', ())):
+            if 'id' in ingredient:
+                ingredient_ids.add(ingredient['id'])
+            if 'nutritional' in ingredient:
+                has_nutritional = True
+            if ingredient.get('external_ids'):
+                has_external_ids = True
+            for allergen in ingredient.get('allergens', ()):
+                bit = allergen_bit.get(allergen)
+                if bit is not None:
+                    allergen_mask |= bit
+                else:
+                    unknown_allergens.add(allergen)
+            self._validate_ingredient(ingredient, i, result)
+
+        device_ids = {dp['id'] for dp in recipe.get('device_profiles', ()) if 'id' in dp}
+
+        # Step references may point forward, so resolve them after the walk
+        pending_step_refs = []
+        for i, step in enumerate(recipe.get('steps', ())):
+            step_id = step.get('step_id')
+            if step_id is not None:
+                step_ids.add(step_id)
+            else:
+                step_id = '?'
+            self._validate_step(step, i, result)
+
+            if 'target' in step and isinstance(step['target'], list):
+                for target in step['target']:
+                    if isinstance(target, str):
+                        if target.startswith('ing-'):
+                            if target not in ingredient_ids:
+                                result.errors.append(
+                                    f"Step {step_id}: Invalid ingredient reference '{target}'")
+                        elif target.endswith(':result'):
+                            pending_step_refs.append((step_id, target))
+
+            if 'device_profile_ref' in step and step['device_profile_ref'] not in device_ids:
+                result.warnings.append(
+                    f"Step {step_id}: Unknown device profile '{step['device_profile_ref']}'")
+
+        for step_id, target in pending_step_refs:
+            step_ref = target[:-7]  # strip ':result'
+            if step_ref not in step_ids:
+                result.errors.append(f"Step {step_id}: Invalid step reference '{target}'")
+
+        return {
+            'ingredient_ids': ingredient_ids,
+            'step_ids': step_ids,
+            'allergen_mask': allergen_mask,
+            'unknown_allergens': unknown_allergens,
+            'has_nutritional': has_nutritional,
+            'has_external_ids': has_external_ids
+        }
+
     def _validate_ingredient(self, ingredient: Dict[str, Any], index: int, result: ValidationResult) -> None:
         """Validate an ingredient"""
 
         # Check ID format
-        if 'id' in ingredient and not self.INGREDIENT_ID_PATTERN.match(ingredient['id']):
+        if 'id' in ingredient and not self._is_ingredient_id(ingredient['id']):
             result.valid = False
             result.errors.append(f"Ingredient {index}: Invalid ID format: {ingredient['id']}")
 
@@ -322,71 +537,44 @@ class RCIPValidator:
             result.errors.append(f"Ingredient {index}: allergens must be an array")
         else:
             # Validate allergen values
-            valid_allergens = [a.value for a in Allergen]
             for allergen in ingredient['allergens']:
-                if allergen not in valid_allergens:
+                if allergen not in self._ALLERGEN_VALUES:
                     result.errors.append(f"Ingredient {index}: Invalid allergen '{allergen}'")
 
         # Check machine amount
-        if 'machine_amount' in ingredient:
-            ma = ingredient['machine_amount']
-            if 'value' not in ma or not isinstance(ma['value'], (int, float)) or ma['value'] < 0:
+        ma = ingredient.get('machine_amount')
+        if ma is not None and not isinstance(ma, dict):
+            result.errors.append(f"Ingredient {index}: machine_amount must be an object")
+        elif ma is not None:
+            value = ma.get('value')
+            if not isinstance(value, (int, float)) or value < 0:
                 result.errors.append(f"Ingredient {index}: machine_amount.value must be non-negative number")
-            if 'unit' not in ma:
+            unit = ma.get('unit')
+            if unit is None:
                 result.errors.append(f"Ingredient {index}: machine_amount.unit is required")
-            elif ma['unit'] not in [u.value for u in Unit]:
-                result.warnings.append(f"Ingredient {index}: Non-standard unit '{ma['unit']}'")
+            elif unit not in self._UNIT_VALUES:
+                result.warnings.append(f"Ingredient {index}: Non-standard unit '{unit}'")
 
     def _validate_step(self, step: Dict[str, Any], index: int, result: ValidationResult) -> None:
         """Validate a step"""
 
         # Check ID format
-        if 'step_id' in step and not self.STEP_ID_PATTERN.match(step['step_id']):
+        if 'step_id' in step and not self._is_step_id(step['step_id']):
             result.valid = False
             result.errors.append(f"Step {index}: Invalid ID format: {step['step_id']}")
 
         # Check action
         if 'action' in step:
-            valid_actions = [a.value for a in CookingAction]
-            if step['action'] not in valid_actions:
+            if step['action'] not in self._ACTION_VALUES:
                 result.errors.append(f"Step {index}: Invalid action '{step['action']}'")
 
         # Check hazards
         if 'hazards' in step and isinstance(step['hazards'], list):
-            valid_hazards = ['hot-surface', 'sharp-tool', 'electrical', 'chemical', 'pressure',
-                             'allergen-cross-contact']
             for hazard in step['hazards']:
-                if hazard not in valid_hazards:
+                if hazard not in self._VALID_HAZARDS:
                     result.warnings.append(f"Step {index}: Non-standard hazard '{hazard}'")
 
-    def _validate_references(self, recipe: Dict[str, Any], result: ValidationResult) -> None:
-        """Validate cross-references between steps and ingredients"""
-
-        ingredient_ids = {ing['id'] for ing in recipe.get('ingredients', []) if 'id' in ing}
-        step_ids = {step['step_id'] for step in recipe.get('steps', []) if 'step_id' in step}
-
-        # Check step targets
-        for step in recipe.get('steps', []):
-            if 'target' in step and isinstance(step['target'], list):
-                for target in step['target']:
-                    if isinstance(target, str):
-                        if target.startswith('ing-') and target not in ingredient_ids:
-                            result.errors.append(
-                                f"Step {step.get('step_id', '?')}: Invalid ingredient reference '{target}'")
-                        elif ':result' in target:
-                            step_ref = target.split(':')[0]
-                            if step_ref not in step_ids:
-                                result.errors.append(
-                                    f"Step {step.get('step_id', '?')}: Invalid step reference '{target}'")
-
-        # Check device profile references
-        device_ids = {dp['id'] for dp in recipe.get('device_profiles', []) if 'id' in dp}
-        for step in recipe.get('steps', []):
-            if 'device_profile_ref' in step and step['device_profile_ref'] not in device_ids:
-                result.warnings.append(
-                    f"Step {step.get('step_id', '?')}: Unknown device profile '{step['device_profile_ref']}'")
-
-    def _check_warnings(self, recipe: Dict[str, Any]) -> List[str]:
+    def _check_warnings(self, recipe: Dict[str, Any], summary: Dict[str, Any]) -> List[str]:
         """Check for warnings (non-critical issues)"""
         warnings = []
 
@@ -403,19 +591,11 @@ class RCIPValidator:
             warnings.append("Missing recommended field: meta.difficulty")
 
         # Check for missing nutritional data
-        has_nutritional = any(
-            'nutritional' in ing
-            for ing in recipe.get('ingredients', [])
-        )
-        if not has_nutritional:
+        if not summary['has_nutritional']:
             warnings.append("No nutritional data provided for any ingredient")
 
         # Check for missing external IDs
-        has_external_ids = any(
-            ing.get('external_ids', {})
-            for ing in recipe.get('ingredients', [])
-        )
-        if not has_external_ids:
+        if not summary['has_external_ids']:
             warnings.append("No external IDs (USDA, GTIN, etc.) provided")
 
         # Check for device profiles without sensors
@@ -433,15 +613,14 @@ class RCIPValidator:
 
         return warnings
 
-    def _get_recipe_info(self, recipe: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_recipe_info(self, recipe: Dict[str, Any], summary: Dict[str, Any]) -> Dict[str, Any]:
         """Get recipe information summary"""
         meta = recipe.get('meta', {})
 
-        # Get all allergens
-        allergens = set()
-        for ingredient in recipe.get('ingredients', []):
-            for allergen in ingredient.get('allergens', []):
-                allergens.add(allergen)
+        mask = summary['allergen_mask']
+        allergens = [name for name in self._ALLERGEN_ORDER if mask & self._ALLERGEN_BIT[name]]
+        if summary['unknown_allergens']:
+            allergens = sorted(set(allergens) | summary['unknown_allergens'])
 
         return {
             'name': meta.get('name', 'Unknown'),
@@ -451,66 +630,87 @@ class RCIPValidator:
             'step_count': len(recipe.get('steps', [])),
             'has_device_profiles': bool(recipe.get('device_profiles')),
             'has_sensors': bool(recipe.get('sensors')),
-            'allergens': sorted(list(allergens)),
+            'allergens': allergens,
+            'allergen_mask': mask,
             'diet_labels': meta.get('diet_labels', []),
             'difficulty': meta.get('difficulty', 'not specified'),
             'total_time': meta.get('total_time_minutes', 'not specified')
         }
 
     def _print_result(self, result: ValidationResult, recipe_name: str) -> None:
-        """Print validation result"""
-        print("\n" + "=" * 60)
-        print(f"Recipe: {recipe_name}")
-        print(f"Status: {'✅ VALID' if result.valid else '❌ INVALID'}")
+        """Print validation result (batched into a single write)"""
+        lines = ["", "=" * 60]
+        lines.append(f"Recipe: {recipe_name}")
+        lines.append(f"Status: {'✅ VALID' if result.valid else '❌ INVALID'}")
 
         if result.info:
-            print("\n📊 Recipe Info:")
-            print(f"  - RCIP Version: {result.info['version']}")
-            print(f"  - Ingredients: {result.info['ingredient_count']}")
-            print(f"  - Steps: {result.info['step_count']}")
-            print(f"  - Difficulty: {result.info['difficulty']}")
-            print(f"  - Total Time: {result.info['total_time']} minutes")
+            lines.append("\n📊 Recipe Info:")
+            lines.append(f"  - RCIP Version: {result.info['version']}")
+            lines.append(f"  - Ingredients: {result.info['ingredient_count']}")
+            lines.append(f"  - Steps: {result.info['step_count']}")
+            lines.append(f"  - Difficulty: {result.info['difficulty']}")
+            lines.append(f"  - Total Time: {result.info['total_time']} minutes")
 
             if result.info['allergens']:
-                print(f"  - Allergens: {', '.join(result.info['allergens'])}")
+                lines.append(f"  - Allergens: {', '.join(result.info['allergens'])}")
 
             if result.info['diet_labels']:
-                print(f"  - Diet Labels: {', '.join(result.info['diet_labels'])}")
+                lines.append(f"  - Diet Labels: {', '.join(result.info['diet_labels'])}")
 
         if result.errors:
-            print(f"\n❌ Errors ({len(result.errors)}):")
-            for i, error in enumerate(result.errors[:10], 1):
-                print(f"  {i}. {error}")
+            lines.append(f"\n❌ Errors ({len(result.errors)}):")
+            for i, error in enumerate(result.format_errors(limit=10), 1):
+                lines.append(f"  {i}. {error}")
             if len(result.errors) > 10:
-                print(f"  ... and {len(result.errors) - 10} more errors")
+                lines.append(f"  ... and {len(result.errors) - 10} more errors")
 
         if result.warnings:
-            print(f"\n⚠️  Warnings ({len(result.warnings)}):")
+            lines.append(f"\n⚠️  Warnings ({len(result.warnings)}):")
             for warning in result.warnings:
-                print(f"  - {warning}")
+                lines.append(f"  - {warning}")
 
-        print("=" * 60)
+        lines.append("=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _print_summary(self) -> None:
-        """Print validation summary"""
-        print("\n" + "=" * 60)
-        print("📈 VALIDATION SUMMARY")
-        print("=" * 60)
-        print(f"Total Validated: {self.stats.validated}")
+        """Print validation summary (batched into a single write)"""
+        lines = ["", "=" * 60, "📈 VALIDATION SUMMARY", "=" * 60]
+        lines.append(f"Total Validated: {self.stats.validated}")
 
         if self.stats.validated > 0:
             pass_rate = (self.stats.passed / self.stats.validated) * 100
             fail_rate = (self.stats.failed / self.stats.validated) * 100
-            print(f"✅ Passed: {self.stats.passed} ({pass_rate:.0f}%)")
-            print(f"❌ Failed: {self.stats.failed} ({fail_rate:.0f}%)")
+            lines.append(f"✅ Passed: {self.stats.passed} ({pass_rate:.0f}%)")
+            lines.append(f"❌ Failed: {self.stats.failed} ({fail_rate:.0f}%)")
 
-        print("=" * 60 + "\n")
+        lines.append("=" * 60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def reset_stats(self) -> None:
         """Reset validation statistics"""
         self.stats = ValidationStats()
 
 
+# Per-process validator, built once by _init_worker and reused for every
+# file the worker handles (schema load/compile is amortized)
+_WORKER_VALIDATOR = None
+
+
+def _init_worker(schema_path: str, schema_version: str, quiet: bool) -> None:
+    """Pool initializer: build one validator per worker process"""
+    global _WORKER_VALIDATOR
+    # Init quietly so workers don't re-print the parent's startup banner,
+    # then restore the caller's flag for the per-file reports
+    _WORKER_VALIDATOR = RCIPValidator(schema_version=schema_version, quiet=True)
+    _WORKER_VALIDATOR.init(schema_path=Path(schema_path))
+    _WORKER_VALIDATOR.quiet = quiet
+
+
+def _validate_worker(file_path: str) -> Tuple[str, ValidationResult]:
+    """Validate one file in a worker process (used by validate_directory)"""
+    return os.path.basename(file_path), _WORKER_VALIDATOR.validate_file(file_path)
+
+
 def main():
     """CLI interface"""
     import argparse
@@ -544,10 +744,16 @@ Examples:
         help='Path to custom schema file'
     )
 
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Suppress per-recipe reports (batch mode)'
+    )
+
     args = parser.parse_args()
 
     # Initialize validator
-    validator = RCIPValidator(schema_version=args.version)
+    validator = RCIPValidator(schema_version=args.version, quiet=args.quiet)
 
     try:
         validator.init(schema_path=args.schema)